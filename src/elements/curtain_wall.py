@@ -1,6 +1,7 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import List, Tuple
+import math
+from typing import Dict, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------
@@ -22,22 +23,313 @@ def _coerce_polyline(crv) -> rg.Polyline:
     return pl
 
 
-def _centered_rect_curve(plane: rg.Plane, size_x: float, size_y: float) -> rg.Curve:
-    """Rectangle centered on plane origin (critical!)."""
+def _box_extrusion(plane: rg.Plane, size_x: float, size_y: float, height_z: float) -> rg.Extrusion:
+    """Box centered on plane origin in X/Y (critical!), rising height_z along plane Z."""
+    # Degenerate boxes (e.g. zero-width mullions): skip the RhinoCommon call
+    if size_x < 1e-9 or size_y < 1e-9 or abs(height_z) < 1e-9:
+        return None
+
     ix = rg.Interval(-size_x * 0.5, size_x * 0.5)
     iy = rg.Interval(-size_y * 0.5, size_y * 0.5)
-    return rg.Rectangle3d(plane, ix, iy).ToNurbsCurve()
-
-
-def _box_brep(plane: rg.Plane, size_x: float, size_y: float, height_z: float) -> rg.Brep:
-    crv = _centered_rect_curve(plane, float(size_x), float(size_y))
-    ext = rg.Extrusion.Create(crv, float(height_z), True)
-    return ext.ToBrep() if ext else None
-
+    iz = rg.Interval(min(0.0, height_z), max(0.0, height_z))
+    # Extrusion rather than Brep: Grasshopper / display take it as is,
+    # callers needing Brep topology can call ToBrep() themselves.
+    return rg.Extrusion.CreateBoxExtrusion(rg.Box(plane, ix, iy, iz), True)
+
+
+# Boxes built once at WorldXY, keyed on (size_x, size_y, height_z)
+_box_template_cache: Dict[Tuple[float, float, float], rg.Extrusion] = {}
+_BOX_TEMPLATE_CACHE_MAX = 256
+
+
+def _box_template(size_x: float, size_y: float, height_z: float) -> rg.Extrusion:
+    """Box at WorldXY for these dimensions, built once and cached."""
+    key = (float(size_x), float(size_y), float(height_z))
+    template = _box_template_cache.get(key)
+    if template is None:
+        template = _box_extrusion(rg.Plane.WorldXY, *key)
+        if not template:
+            return None
+        if len(_box_template_cache) >= _BOX_TEMPLATE_CACHE_MAX:
+            _box_template_cache.clear()
+        _box_template_cache[key] = template
+    return template
+
+
+# Primitive kinds emitted by _plan_curtain_wall
+_MULLION = 0
+_TRANSOM = 1
+_GLASS = 2
+
+
+def _plan_segment(
+    p0: Tuple[float, float, float],
+    p1: Tuple[float, float, float],
+    xax: Tuple[float, float, float],
+    yax: Tuple[float, float, float],
+    panel_count: int,
+    step: float,
+    inset_sign: float,
+    mullion_width_mm: float,
+    mullion_depth_mm: float,
+    transom_height_mm: float,
+    transom_depth_mm: float,
+    panel_thickness_mm: float,
+    glass_inset_mm: float,
+    glass_gap_mm: float,
+    story_height_mm: float,
+):
+    """
+    Pure-float layout of one polyline segment (no RhinoCommon calls).
+
+    Depends only on its arguments, so segments can be planned independently
+    once their axes are known. Returns parallel lists
+    (origins, xaxes, yaxes, sizes, kinds), one row per box:
+    origin / axes as (x, y, z) tuples, size as (size_x, size_y, height_z).
+    """
+    origins: List[Tuple[float, float, float]] = []
+
+    x0, y0, base_z = p0
+
+    # Bay-independent dimensions
+    edge_offset = mullion_width_mm * 0.5
+    clear_height = story_height_mm - 2.0 * transom_height_mm - 2.0 * glass_gap_mm
+    mullion_size = (mullion_width_mm, mullion_depth_mm, story_height_mm)
+
+    # Glass is inset from the OUTER face of mullion.
+    # Mullion is centered on guide. Outer face is +yaxis*(mullion_depth/2).
+    # Inset goes inward (towards -yaxis); inset_sign = -1.0 mirrors it to the
+    # other side without touching yaxis, so box planes keep Z up.
+    glass_center_offset = (mullion_depth_mm * 0.5) - glass_inset_mm - (panel_thickness_mm * 0.5)
+
+    # Clear span between mullion inner faces; same for every bay
+    clear_span = step - 2.0 * edge_offset
+    clear_width = clear_span - 2.0 * glass_gap_mm
+    has_infill = clear_span > 1e-6 and clear_width > 1e-6 and clear_height > 1e-6
+
+    transom_size = (clear_span, transom_depth_mm, transom_height_mm)
+    glass_size = (clear_width, panel_thickness_mm, clear_height)
+
+    # Every bay emits the same boxes: mullion [, bottom transom, top transom, glass]
+    if has_infill:
+        bay_sizes = [mullion_size, transom_size, transom_size, glass_size]
+        bay_kinds = [_MULLION, _TRANSOM, _TRANSOM, _GLASS]
+    else:
+        bay_sizes = [mullion_size]
+        bay_kinds = [_MULLION]
+
+    inset_dx = -yax[0] * glass_center_offset * inset_sign
+    inset_dy = -yax[1] * glass_center_offset * inset_sign
+    half_step = step * 0.5
+
+    bot_z = base_z
+    top_z = base_z + story_height_mm - transom_height_mm
+    glass_z = base_z + transom_height_mm + glass_gap_mm
+
+    for j in range(panel_count):
+        d0 = j * step
+        bx = x0 + xax[0] * d0
+        by = y0 + xax[1] * d0
+
+        # --- mullion at bay start (centered on guide) ---
+        mull_origin = (bx, by, base_z + xax[2] * d0)
+
+        if not has_infill:
+            origins.append(mull_origin)
+            continue
+
+        # bay midpoint (halfway between the mullion inner faces)
+        mx = bx + xax[0] * half_step
+        my = by + xax[1] * half_step
+
+        # --- transoms: centered on guide; glass inset from the OUTER face of mullion ---
+        origins.extend((
+            mull_origin,
+            (mx, my, bot_z),
+            (mx, my, top_z),
+            (mx + inset_dx, my + inset_dy, glass_z),
+        ))
+
+    # --- final mullion at segment end ---
+    origins.append(p1)
+
+    row_count = len(origins)
+    sizes = bay_sizes * panel_count + [mullion_size]
+    kinds = bay_kinds * panel_count + [_MULLION]
+
+    return origins, [xax] * row_count, [yax] * row_count, sizes, kinds
+
+
+def _plan_frames(
+    pts: List[Tuple[float, float, float]],
+    frames: List[tuple],
+    mullion_width_mm: float,
+    mullion_depth_mm: float,
+    transom_height_mm: float,
+    transom_depth_mm: float,
+    panel_thickness_mm: float,
+    glass_inset_mm: float,
+    glass_gap_mm: float,
+    story_height_mm: float,
+):
+    """
+    Run _plan_segment for every frame (i, xax, yax, panel_count, step,
+    inset_sign) and concatenate the rows.
+
+    Frames carry the only cross-segment state (yaxis orientation and glass
+    side), so the segments themselves are a plain map.
+    """
+    origins: List[Tuple[float, float, float]] = []
+    xaxes: List[Tuple[float, float, float]] = []
+    yaxes: List[Tuple[float, float, float]] = []
+    sizes: List[Tuple[float, float, float]] = []
+    kinds: List[int] = []
+
+    for i, xax, yax, panel_count, step, inset_sign in frames:
+        seg_origins, seg_xaxes, seg_yaxes, seg_sizes, seg_kinds = _plan_segment(
+            pts[i],
+            pts[i + 1],
+            xax,
+            yax,
+            panel_count,
+            step,
+            inset_sign,
+            mullion_width_mm,
+            mullion_depth_mm,
+            transom_height_mm,
+            transom_depth_mm,
+            panel_thickness_mm,
+            glass_inset_mm,
+            glass_gap_mm,
+            story_height_mm,
+        )
+
+        origins.extend(seg_origins)
+        xaxes.extend(seg_xaxes)
+        yaxes.extend(seg_yaxes)
+        sizes.extend(seg_sizes)
+        kinds.extend(seg_kinds)
+
+    return origins, xaxes, yaxes, sizes, kinds
+
+
+def _ring_flip(pts: List[Tuple[float, float, float]]) -> Optional[float]:
+    """
+    Glass inset sign for a closed ring, from its signed area in XY (shoelace):
+    +1.0 for a CCW ring, -1.0 for a CW one, so the glass ends up on the same
+    side of the ring either way. None for open polylines.
+    """
+    closed = (
+        len(pts) > 3
+        and abs(pts[0][0] - pts[-1][0]) < 1e-6
+        and abs(pts[0][1] - pts[-1][1]) < 1e-6
+        and abs(pts[0][2] - pts[-1][2]) < 1e-6
+    )
+    if not closed:
+        return None
+
+    area2 = 0.0
+    for i in range(len(pts) - 1):
+        area2 += pts[i][0] * pts[i + 1][1] - pts[i + 1][0] * pts[i][1]
+
+    return -1.0 if area2 < 0 else 1.0
+
+
+def _is_horizontal(pts: List[Tuple[float, float, float]], tol: float = 1e-6) -> bool:
+    z = pts[0][2]
+    return all(abs(p[2] - z) < tol for p in pts)
+
+
+def _plan_curtain_wall(
+    pts: List[Tuple[float, float, float]],
+    mullion_spacing_mm: float,
+    mullion_width_mm: float,
+    mullion_depth_mm: float,
+    transom_height_mm: float,
+    transom_depth_mm: float,
+    panel_thickness_mm: float,
+    glass_inset_mm: float,
+    glass_gap_mm: float,
+    story_height_mm: float,
+):
+    """
+    Pure-float layout of one story: segment frames, then _plan_frames.
+
+    Horizontal polylines (the common case) skip the yaxis hypot and its
+    degenerate fallback. Closed rings take their glass side from the signed
+    area (shoelace) instead of the per-segment consistency check.
+
+    Returns the concatenated parallel lists (origins, xaxes, yaxes, sizes, kinds).
+    """
+    # (i, xax, yax, panel_count, step, inset_sign) per non-degenerate segment
+    frames = []
+
+    # Segment lengths, computed once on raw floats
+    seg_lens: List[float] = []
+    for i in range(len(pts) - 1):
+        dx = pts[i + 1][0] - pts[i][0]
+        dy = pts[i + 1][1] - pts[i][1]
+        dz = pts[i + 1][2] - pts[i][2]
+        seg_lens.append(math.sqrt(dx * dx + dy * dy + dz * dz))
+
+    # Axes stay in XY when all points share one Z
+    horizontal = _is_horizontal(pts)
+
+    # Closed rings: one glass side for the whole ring (signed area in XY)
+    ring_flip = _ring_flip(pts)
+    closed = ring_flip is not None
+    inset_sign = ring_flip if closed else 1.0
+
+    # Used to keep yaxis consistent across segments of an open polyline
+    prev_yaxis = None
 
-def _panel_brep(plane: rg.Plane, width_mm: float, height_mm: float, thickness_mm: float) -> rg.Brep:
-    # thickness is the "depth" in plane Y
-    return _box_brep(plane, float(width_mm), float(thickness_mm), float(height_mm))
+    for i in range(len(pts) - 1):
+        seg_len = seg_lens[i]
+        if seg_len <= 1e-6:
+            continue
+
+        # Panels along this segment
+        panel_count = max(1, int(seg_len // mullion_spacing_mm))
+        step = seg_len / panel_count
+
+        inv = 1.0 / seg_len
+        xax = (
+            (pts[i + 1][0] - pts[i][0]) * inv,
+            (pts[i + 1][1] - pts[i][1]) * inv,
+            (pts[i + 1][2] - pts[i][2]) * inv,
+        )
+
+        # Candidate yaxis (left of segment in world Z-up) = ZAxis x xaxis
+        if horizontal:
+            # xaxis lies in XY: already unit length, never degenerate
+            yax = (-xax[1], xax[0], 0.0)
+        else:
+            y_len = math.hypot(xax[0], xax[1])
+            if y_len <= 1e-12:
+                yax = (0.0, 1.0, 0.0)
+            else:
+                yax = (-xax[1] / y_len, xax[0] / y_len, 0.0)
+
+        # ---- keep yaxis consistent across segments (open polylines) ----
+        if not closed:
+            if prev_yaxis is not None and yax[0] * prev_yaxis[0] + yax[1] * prev_yaxis[1] < 0:
+                yax = (-yax[0], -yax[1], 0.0)
+            prev_yaxis = yax
+
+        frames.append((i, xax, yax, panel_count, step, inset_sign))
+
+    return _plan_frames(
+        pts,
+        frames,
+        mullion_width_mm,
+        mullion_depth_mm,
+        transom_height_mm,
+        transom_depth_mm,
+        panel_thickness_mm,
+        glass_inset_mm,
+        glass_gap_mm,
+        story_height_mm,
+    )
 
 
 # ---------------------------------------------------------------------
@@ -60,7 +352,7 @@ def curtain_wall(
 
     story_height_mm: int = 3200,
     stories: int = 1
-) -> Tuple[List[rg.Brep], List[rg.Brep]]:
+) -> Tuple[List[rg.GeometryBase], List[rg.GeometryBase]]:
 
     pl = _coerce_polyline(guide)
 
@@ -78,119 +370,100 @@ def curtain_wall(
     story_height_mm = float(story_height_mm)
     stories = int(stories)
 
-    breps_mullions: List[rg.Brep] = []
-    breps_glass: List[rg.Brep] = []
-
-    # Used to keep yaxis consistent across polyline segments
-    prev_yaxis = None
-
-
-
-    for s in range(stories):
-        z0 = s * story_height_mm
-        z1 = z0 + story_height_mm
-
-        for i in range(pl.Count - 1):
-            p_start = rg.Point3d(pl[i])
-            p_end = rg.Point3d(pl[i + 1])
-
-            seg_vec = p_end - p_start
-            seg_len = seg_vec.Length
-
-            base_z = p_start.Z
-
-            if seg_len <= 1e-6:
-                continue
-
-            xaxis = rg.Vector3d(seg_vec)
-            xaxis.Unitize()
-
-            # Candidate yaxis (left of segment in world Z-up)
-            yaxis = rg.Vector3d.CrossProduct(rg.Vector3d.ZAxis, xaxis)
-            if yaxis.IsTiny():
-                yaxis = rg.Vector3d.YAxis
-            yaxis.Unitize()
-
-            # ---- keep yaxis consistent across segments ----
-            if prev_yaxis is not None and rg.Vector3d.Multiply(yaxis, prev_yaxis) < 0:
-                yaxis.Reverse()
-            prev_yaxis = rg.Vector3d(yaxis)
-
-            # Panels along this segment
-            panel_count = max(1, int(seg_len // mullion_spacing_mm))
-            step = seg_len / panel_count
-
-            for j in range(panel_count):
-                d0 = j * step
-                d1 = (j + 1) * step
-
-                base_pt = p_start + xaxis * d0
-                next_pt = p_start + xaxis * d1
-
-                base_pt.Z += z0
-                next_pt.Z += z0
-
-                # --- mullion at bay start (centered on guide) ---
-                mull_plane = rg.Plane(base_pt, xaxis, yaxis)
-                mull = _box_brep(mull_plane, mullion_width_mm, mullion_depth_mm, story_height_mm)
-                if mull:
-                    breps_mullions.append(mull)
-
-                # --- clear span between mullion inner faces (edge-based) ---
-                edge_offset = mullion_width_mm * 0.5
-                panel_start = base_pt + xaxis * edge_offset
-                panel_end = next_pt - xaxis * edge_offset
-
-                clear_vec = panel_end - panel_start
-                clear_span = clear_vec.Length
-                if clear_span <= 1e-6:
-                    continue
-
-                clear_width = clear_span - 2.0 * glass_gap_mm
-                clear_height = story_height_mm - 2.0 * transom_height_mm - 2.0 * glass_gap_mm
-
-                if clear_width <= 1e-6 or clear_height <= 1e-6:
-                    continue
-
-                clear_dir = rg.Vector3d(clear_vec)
-                clear_dir.Unitize()
-
-                mid = (panel_start + panel_end) * 0.5
-
-                # --- transoms: centered on guide (NO unintended forward shift anymore) ---
-                bot_mid = rg.Point3d(mid.X, mid.Y, base_z + z0)
-                bot_plane = rg.Plane(bot_mid, clear_dir, yaxis)
-                bottom = _box_brep(bot_plane, clear_span, transom_depth_mm, transom_height_mm)
-                if bottom:
-                    breps_mullions.append(bottom)
-
-                top_mid = rg.Point3d(mid.X, mid.Y, base_z + z1 - transom_height_mm)
-                top_plane = rg.Plane(top_mid, clear_dir, yaxis)
-                top = _box_brep(top_plane, clear_span, transom_depth_mm, transom_height_mm)
-                if top:
-                    breps_mullions.append(top)
-
-                # --- glass: inset from the OUTER face of mullion ---
-                # Mullion is centered on guide. Outer face is +yaxis*(mullion_depth/2).
-                # Inset goes inward (towards -yaxis).
-                glass_center_offset = (mullion_depth_mm * 0.5) - glass_inset_mm - (panel_thickness_mm * 0.5)
-                glass_origin = rg.Point3d(
-                    mid.X - yaxis.X * glass_center_offset,
-                    mid.Y - yaxis.Y * glass_center_offset,
-                    base_z + z0 + transom_height_mm + glass_gap_mm
-                )
-                glass_plane = rg.Plane(glass_origin, clear_dir, yaxis)
-
-                glass = _panel_brep(glass_plane, clear_width, clear_height, panel_thickness_mm)
-                if glass:
-                    breps_glass.append(glass)
-
-            # --- final mullion at segment end ---
-            end_pt = rg.Point3d(p_end)
-            end_pt.Z += z0
-            end_plane = rg.Plane(end_pt, xaxis, yaxis)
-            end_mull = _box_brep(end_plane, mullion_width_mm, mullion_depth_mm, story_height_mm)
-            if end_mull:
-                breps_mullions.append(end_mull)
+    if stories < 1:
+        return [], []
+
+    # --------------------------------------------------
+    # Story 0: plan every box on floats, then build the geometry
+    # --------------------------------------------------
+    # Read each vertex once (one Point3d by value), no copies or re-indexing
+    pts = [(p.X, p.Y, p.Z) for p in pl]
+
+    origins, xaxes, yaxes, sizes, kinds = _plan_curtain_wall(
+        pts,
+        mullion_spacing_mm,
+        mullion_width_mm,
+        mullion_depth_mm,
+        transom_height_mm,
+        transom_depth_mm,
+        panel_thickness_mm,
+        glass_inset_mm,
+        glass_gap_mm,
+        story_height_mm,
+    )
+
+    # Output slots sized up front from the plan; index-assigned, trimmed below
+    glass_count = kinds.count(_GLASS)
+    mullions_s0: List[rg.GeometryBase] = [None] * (len(kinds) - glass_count)
+    glass_s0: List[rg.GeometryBase] = [None] * glass_count
+    idx_m = 0
+    idx_g = 0
+
+    # One template per distinct box size, resolved before the build loop
+    templates = {size: _box_template(*size) for size in set(sizes)}
+    world_xy = rg.Plane.WorldXY
+
+    # Rows of one segment share their axis tuples: build one plane per
+    # segment and only move its origin per row
+    xax = yax = None
+    plane = None
+
+    for k in range(len(kinds)):
+        if xaxes[k] is not xax or yaxes[k] is not yax:
+            xax = xaxes[k]
+            yax = yaxes[k]
+            plane = rg.Plane(
+                rg.Point3d.Origin,
+                rg.Vector3d(xax[0], xax[1], xax[2]),
+                rg.Vector3d(yax[0], yax[1], yax[2]),
+            )
+
+        template = templates[sizes[k]]
+        if not template:
+            continue
+
+        o = origins[k]
+        plane.Origin = rg.Point3d(o[0], o[1], o[2])
+
+        box = template.Duplicate()
+        box.Transform(rg.Transform.PlaneToPlane(world_xy, plane))
+
+        if kinds[k] == _GLASS:
+            glass_s0[idx_g] = box
+            idx_g += 1
+        else:
+            mullions_s0[idx_m] = box
+            idx_m += 1
+
+    # drop the slots of boxes that failed to build
+    del mullions_s0[idx_m:]
+    del glass_s0[idx_g:]
+
+    # --------------------------------------------------
+    # Stories above are pure Z translations of story 0
+    # --------------------------------------------------
+    n_m = len(mullions_s0)
+    n_g = len(glass_s0)
+
+    breps_mullions: List[rg.GeometryBase] = [None] * (stories * n_m)
+    breps_glass: List[rg.GeometryBase] = [None] * (stories * n_g)
+
+    breps_mullions[:n_m] = mullions_s0
+    breps_glass[:n_g] = glass_s0
+
+    for s in range(1, stories):
+        tz = rg.Transform.Translation(0, 0, s * story_height_mm)
+
+        offset = s * n_m
+        for k in range(n_m):
+            c = mullions_s0[k].Duplicate()
+            c.Transform(tz)
+            breps_mullions[offset + k] = c
+
+        offset = s * n_g
+        for k in range(n_g):
+            c = glass_s0[k].Duplicate()
+            c.Transform(tz)
+            breps_glass[offset + k] = c
 
     return breps_mullions, breps_glass
@@ -1,6 +1,6 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import List
+from typing import Dict, List, Tuple
 
 
 # ---------------------------------------------------------------------
@@ -43,6 +43,11 @@ def _frame_at(crv: rg.Curve, t: float) -> rg.Plane:
     return rg.Plane(pt, x, y)
 
 
+# Centered rectangles built once at WorldXY, keyed on (depth, width)
+_rect_cache: Dict[Tuple[float, float], rg.NurbsCurve] = {}
+_RECT_CACHE_MAX = 64
+
+
 def _rect_profile_xy(
     plane: rg.Plane,
     depth: float,
@@ -50,12 +55,25 @@ def _rect_profile_xy(
 ) -> rg.Curve:
     """
     Rectangle in plane XY (depth along X, width along Y), centered.
+
+    Copies a cached WorldXY rectangle onto the plane instead of
+    rebuilding the NURBS curve for every post.
     """
-    return rg.Rectangle3d(
-        plane,
-        rg.Interval(-depth * 0.5, depth * 0.5),
-        rg.Interval(-width * 0.5, width * 0.5),
-    ).ToNurbsCurve()
+    key = (float(depth), float(width))
+    template = _rect_cache.get(key)
+    if template is None:
+        template = rg.Rectangle3d(
+            rg.Plane.WorldXY,
+            rg.Interval(-key[0] * 0.5, key[0] * 0.5),
+            rg.Interval(-key[1] * 0.5, key[1] * 0.5),
+        ).ToNurbsCurve()
+        if len(_rect_cache) >= _RECT_CACHE_MAX:
+            _rect_cache.clear()
+        _rect_cache[key] = template
+
+    crv = template.DuplicateCurve()
+    crv.Transform(rg.Transform.PlaneToPlane(rg.Plane.WorldXY, plane))
+    return crv
 
 
 def _post_brep_between_z(
@@ -1,6 +1,6 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import Dict, Iterable, Optional, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 
 # ---------------------------------------------------------------------
@@ -25,23 +25,29 @@ def _coerce_curves(crvs: Optional[Union[rg.Curve, Iterable]]) -> Iterable[rg.Cur
     return [_coerce_curve(crvs)]
 
 
+def _translate_z(curves: Iterable[rg.Curve], dz: float) -> None:
+    xform = rg.Transform.Translation(0, 0, float(dz))
+    for crv in curves:
+        crv.Transform(xform)
+
+
 def _planar_slab(
     curve: rg.Curve,
-    z_base: float,
     thickness: float,
     voids: Iterable[rg.Curve],
-) -> Optional[rg.Brep]:
+) -> Optional[rg.GeometryBase]:
     """
     Create a planar slab by extruding a curve downward,
     with optional void subtraction.
+
+    Curve and voids must already sit at the slab top; they are not modified.
+    Without voids the Extrusion is returned as is; a Brep is only built
+    when a boolean difference needs one.
     """
 
     # Base slab
-    crv = curve.Duplicate()
-    crv.Transform(rg.Transform.Translation(0, 0, float(z_base)))
-
     slab_ext = rg.Extrusion.Create(
-        crv,
+        curve,
         -float(thickness),  # extrude DOWN
         True,
     )
@@ -49,6 +55,9 @@ def _planar_slab(
     if not slab_ext:
         return None
 
+    if not voids:
+        return slab_ext
+
     slab = slab_ext.ToBrep()
 
     # ---------------------------------------------
@@ -57,11 +66,8 @@ def _planar_slab(
     tol = 0.01
 
     for void in voids:
-        void_crv = void.Duplicate()
-        void_crv.Transform(rg.Transform.Translation(0, 0, float(z_base)))
-
         void_ext = rg.Extrusion.Create(
-            void_crv,
+            void,
             -float(thickness),
             True,
         )
@@ -83,6 +89,46 @@ def _planar_slab(
     return slab
 
 
+def _build_layers(
+    crv: rg.Curve,
+    void_crvs: List[rg.Curve],
+    z_current: float,
+    elevation_mm: float,
+    finish_thickness_mm: float,
+    screed_thickness_mm: float,
+    insulation_thickness_mm: float,
+    structural_thickness_mm: float,
+) -> Tuple[Dict[str, rg.GeometryBase], float]:
+    """
+    Four-layer build-up from working curves that are currently
+    translated by z_current (relative to the input boundary).
+
+    The curves are moved in place, layer by layer; returns the layers and
+    the translation the curves end at, so the next call can continue from it.
+    """
+    curves = [crv] + void_crvs
+    layers: Dict[str, rg.GeometryBase] = {}
+
+    z = float(elevation_mm)
+    _translate_z(curves, z - z_current)
+
+    layers["finish"] = _planar_slab(crv, finish_thickness_mm, void_crvs)
+    _translate_z(curves, -finish_thickness_mm)
+    z -= finish_thickness_mm
+
+    layers["screed"] = _planar_slab(crv, screed_thickness_mm, void_crvs)
+    _translate_z(curves, -screed_thickness_mm)
+    z -= screed_thickness_mm
+
+    layers["insulation"] = _planar_slab(crv, insulation_thickness_mm, void_crvs)
+    _translate_z(curves, -insulation_thickness_mm)
+    z -= insulation_thickness_mm
+
+    layers["structural"] = _planar_slab(crv, structural_thickness_mm, void_crvs)
+
+    return layers, z
+
+
 # ---------------------------------------------------------------------
 # main
 # ---------------------------------------------------------------------
@@ -96,37 +142,81 @@ def floor_plate(
     insulation_thickness_mm: float = 30,
     structural_thickness_mm: float = 250,
     voids=None,
-) -> Dict[str, rg.Brep]:
+) -> Dict[str, rg.GeometryBase]:
     """
     Multi-layer floor build-up (top → bottom).
 
     Optional void curves are subtracted from all layers
     (e.g. stair openings, shafts).
 
-    Returns:
+    Returns (Extrusion per layer, or Brep where voids were subtracted):
       {
-        "finish": Brep,
-        "screed": Brep,
-        "insulation": Brep,
-        "structural": Brep
+        "finish": Extrusion | Brep,
+        "screed": Extrusion | Brep,
+        "insulation": Extrusion | Brep,
+        "structural": Extrusion | Brep
       }
     """
 
     boundary = _coerce_curve(boundary)
     voids = _coerce_curves(voids)
 
-    z = float(elevation_mm)
-    layers: Dict[str, rg.Brep] = {}
+    # One working copy of each curve, lowered layer by layer
+    crv = boundary.Duplicate()
+    void_crvs = [v.Duplicate() for v in voids]
 
-    layers["finish"] = _planar_slab(boundary, z, finish_thickness_mm, voids)
-    z -= finish_thickness_mm
+    layers, _ = _build_layers(
+        crv,
+        void_crvs,
+        0.0,
+        elevation_mm,
+        finish_thickness_mm,
+        screed_thickness_mm,
+        insulation_thickness_mm,
+        structural_thickness_mm,
+    )
 
-    layers["screed"] = _planar_slab(boundary, z, screed_thickness_mm, voids)
-    z -= screed_thickness_mm
+    return layers
 
-    layers["insulation"] = _planar_slab(boundary, z, insulation_thickness_mm, voids)
-    z -= insulation_thickness_mm
 
-    layers["structural"] = _planar_slab(boundary, z, structural_thickness_mm, voids)
+def floor_plates(
+    boundary,
+    elevations_mm: Sequence[float],
+    finish_thickness_mm: float = 15,
+    screed_thickness_mm: float = 70,
+    insulation_thickness_mm: float = 30,
+    structural_thickness_mm: float = 250,
+    voids=None,
+) -> List[Dict[str, rg.GeometryBase]]:
+    """
+    floor_plate for several elevations at once (e.g. one per story).
 
-    return layers
+    Boundary and voids are coerced and duplicated once; the same working
+    curves are moved from floor to floor.
+
+    Returns one layer dict (see floor_plate) per elevation, in input order.
+    """
+
+    boundary = _coerce_curve(boundary)
+    voids = _coerce_curves(voids)
+
+    crv = boundary.Duplicate()
+    void_crvs = [v.Duplicate() for v in voids]
+
+    plates: List[Dict[str, rg.GeometryBase]] = []
+    z = 0.0
+
+    for elevation_mm in elevations_mm:
+        layers, z = _build_layers(
+            crv,
+            void_crvs,
+            z,
+            elevation_mm,
+            finish_thickness_mm,
+            screed_thickness_mm,
+            insulation_thickness_mm,
+            structural_thickness_mm,
+        )
+        plates.append(layers)
+
+    return plates
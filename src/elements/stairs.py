@@ -98,6 +98,10 @@ def stair_from_polyline(
         # Base origin stays on reference line
         base_origin = p0 + left * _alignment_offset(width_mm, side)
 
+        # Scalar copies for per-tread origins (no Point3d/Vector3d arithmetic)
+        ox, oy, oz = base_origin.X, base_origin.Y, base_origin.Z
+        dx, dy, dz = dir.X, dir.Y, dir.Z
+
         # ----------------------------------------------
         # Treads in this flight
         # ----------------------------------------------
@@ -105,9 +109,8 @@ def stair_from_polyline(
             if current_step >= tread_count:
                 break
 
-            origin = (
-                base_origin + dir * (s * tread_depth_mm) + rg.Vector3d.ZAxis * current_z
-            )
+            d = s * tread_depth_mm
+            origin = rg.Point3d(ox + dx * d, oy + dy * d, oz + dz * d + current_z)
 
             plane = rg.Plane(origin, dir, left)
 
@@ -128,11 +131,8 @@ def stair_from_polyline(
         # Landing at kink
         # ----------------------------------------------
         if i < pl.Count - 2 and current_step < tread_count:
-            landing_origin = (
-                base_origin
-                + dir * (steps_here * tread_depth_mm)
-                + rg.Vector3d.ZAxis * current_z
-            )
+            d = steps_here * tread_depth_mm
+            landing_origin = rg.Point3d(ox + dx * d, oy + dy * d, oz + dz * d + current_z)
 
             plane = rg.Plane(landing_origin, dir, left)
 